@@ -1,19 +1,26 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import csv
+import io
 import os
-import json
 import uuid
 import base64
+import shutil
+import queue
+import operator
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
+from urllib.parse import urljoin
 from slugify import slugify
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import time
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 
 # --- Config ---
 BASE_URL = "https://ebpnet.be/nl/api/v1/guideline/search"
@@ -29,61 +36,319 @@ os.makedirs(DOWNLOADS_DIR, exist_ok=True)
 TEST_MODE = True
 MAX_TEST_GUIDELINES = 2
 
+# CSV output
+CSV_FILENAME = "public_guidelines_detailed.csv"
+CSV_HEADER = [
+    'title', 'published_date', 'publisher',
+    'professions', 'source_label', 'source_type', 'pdf_path'
+]
+CSV_FLUSH_EVERY = 10
+CSV_QUEUE_SIZE = 100
+CSV_BUFFER_SIZE = 1 << 16
+
+# Worker threads: HTTP-only guidelines, Chrome-rendered guidelines, API pages
+FAST_WORKERS = 16
+SELENIUM_WORKERS = 3
+PAGE_WORKERS = 8
+
+# HTTP (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (5, 30)
+DOWNLOAD_TIMEOUT = (5, 60)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# A PDF starts with "%PDF-" within its first 1024 bytes
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+PRINT_CHUNK_SIZE = 256 * 1024
+
+# How long html_to_pdf waits for the main content, and how often it checks (seconds)
+CONTENT_TIMEOUT = 15
+CONTENT_POLL_INTERVAL = 0.5
+
 # --- Logging ---
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# --- HTTP session ---
+# One pooled session so repeated calls to ebpnet.be reuse the same connection
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=max(FAST_WORKERS, PAGE_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# --- Chrome drivers ---
+# One headless Chrome per thread, reused across guidelines and quit at exit
+# Resources the printed PDF doesn't need; stylesheets are kept for the layout
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.plugins": 2
+}
+CHROME_BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.woff2", "*.woff", "*google-analytics*", "*googletagmanager*"]
+
+_tls = threading.local()
+# Strong references: pool threads (and their thread-locals) are gone by the
+# time the drivers need to be quit
+_drivers = set()
+_drivers_lock = threading.Lock()
+
+def _get_driver() -> webdriver.Chrome:
+    driver = getattr(_tls, "driver", None)
+    if driver is None:
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-gpu")
+        options.add_experimental_option("prefs", CHROME_PREFS)
+        # Return from driver.get at DOMContentLoaded; we wait for the content ourselves
+        options.page_load_strategy = "eager"
+
+        # Selenium Manager resolves and caches chromedriver itself
+        driver = webdriver.Chrome(options=options)
+        _tls.driver = driver
+        with _drivers_lock:
+            _drivers.add(driver)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": CHROME_BLOCKED_URLS})
+    return driver
+
+def _discard_driver():
+    driver = getattr(_tls, "driver", None)
+    _tls.driver = None
+    if driver is not None:
+        with _drivers_lock:
+            _drivers.discard(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+def _shutdown_all_drivers():
+    with _drivers_lock:
+        drivers = list(_drivers)
+        _drivers.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+atexit.register(_shutdown_all_drivers)
+
 # --- PDF Generation ---
+def _pdf_path_for(name: str) -> str:
+    # Filename from title + uuid
+    filename = slugify(f"{name}-{str(uuid.uuid4())[:8]}")
+    return os.path.join(DOWNLOADS_DIR, f"{filename}.pdf")
+
+def _remove_partial(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+class _PdfLinkParser(HTMLParser):
+    """Finds the href of the first <a class="btn-blue"> whose text mentions "pdf"."""
+
+    def __init__(self):
+        super().__init__()
+        self.pdf_href = None
+        self._href = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a" or self.pdf_href:
+            return
+        attrs = dict(attrs)
+        if "btn-blue" in (attrs.get("class") or "").split():
+            self._href = attrs.get("href")
+            self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._href is not None:
+            if "pdf" in "".join(self._text).lower():
+                self.pdf_href = self._href
+            self._href = None
+
+def _try_fast_path(url: str) -> str:
+    """
+    Fetch the guideline page without a browser and look for a direct PDF link.
+    Returns the absolute PDF URL, or "" if the page needs to be rendered.
+    """
+    try:
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Could not fetch {url} without a browser: {e}")
+        return ""
+
+    parser = _PdfLinkParser()
+    parser.feed(response.text)
+    return urljoin(url, parser.pdf_href) if parser.pdf_href else ""
+
+def _download_linked_pdf(pdf_url: str, name: str) -> str:
+    """
+    Download a PDF linked from a guideline page.
+    Returns the path to the saved PDF, or "" if the download failed or the
+    link didn't point to a PDF.
+    """
+    pdf_path = _pdf_path_for(name)
+    part_path = f"{pdf_path}.part"
+    logger.info(f"Downloading PDF for {name} from {pdf_url} to {pdf_path}")
+    try:
+        # Stream to disk so a large PDF is never held in memory as a whole;
+        # write to a temporary name so a broken download leaves no truncated PDF
+        with SESSION.get(pdf_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as pdf_response:
+            pdf_response.raise_for_status()
+            pdf_response.raw.decode_content = True
+            # The link may lead to an HTML landing page or a publisher site
+            head = pdf_response.raw.read(PDF_HEADER_WINDOW)
+            if PDF_MAGIC not in head:
+                content_type = pdf_response.headers.get("Content-Type", "unknown")
+                logger.warning(f"{pdf_url} is not a PDF (Content-Type: {content_type}); printing the page instead")
+                return ""
+            with open(part_path, "wb") as f:
+                f.write(head)
+                shutil.copyfileobj(pdf_response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(part_path, pdf_path)
+    except Exception as e:
+        logger.exception(f"Failed to download PDF from {pdf_url}: {e}")
+        _remove_partial(part_path)
+        return ""
+
+    return pdf_path
+
+def save_linked_pdf(url: str, name: str) -> str:
+    """
+    Save the PDF linked from a guideline page without starting a browser.
+    Returns the path to the saved PDF, or "" if the page has to be printed
+    with html_to_pdf instead.
+    """
+    pdf_url = _try_fast_path(url)
+    return _download_linked_pdf(pdf_url, name) if pdf_url else ""
+
+def _wait_for_content(driver: webdriver.Chrome):
+    """Wait up to CONTENT_TIMEOUT seconds for the main content to appear."""
+    deadline = time.monotonic() + CONTENT_TIMEOUT
+    while True:
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": "!!document.querySelector('.editorial-text')",
+            "returnByValue": True
+        })
+        if result.get("result", {}).get("value"):
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutException(f"editorial-text not found after {CONTENT_TIMEOUT}s")
+        time.sleep(CONTENT_POLL_INTERVAL)
+
+def _print_page_to_pdf(driver: webdriver.Chrome, pdf_path: str):
+    """
+    Print the current page with CDP Page.printToPDF and stream the result to
+    `pdf_path` in chunks, instead of receiving the whole PDF as one base64 string.
+    """
+    result = driver.execute_cdp_cmd("Page.printToPDF", {
+        "printBackground": False,
+        "displayHeaderFooter": False,
+        "transferMode": "ReturnAsStream"
+    })
+    handle = result["stream"]
+    # Write to a temporary name and only move it into place once the stream hits EOF
+    part_path = f"{pdf_path}.part"
+    try:
+        with open(part_path, "wb") as f:
+            while True:
+                chunk = driver.execute_cdp_cmd("IO.read", {"handle": handle, "size": PRINT_CHUNK_SIZE})
+                data = chunk.get("data", "")
+                f.write(base64.b64decode(data) if chunk.get("base64Encoded") else data.encode())
+                if chunk.get("eof"):
+                    break
+        os.replace(part_path, pdf_path)
+    except Exception:
+        _remove_partial(part_path)
+        raise
+    finally:
+        try:
+            driver.execute_cdp_cmd("IO.close", {"handle": handle})
+        except Exception:
+            pass
+
+def _clear_cookies(driver: webdriver.Chrome):
+    """Reset the driver between guidelines; a driver that can't be reset is quit."""
+    try:
+        driver.delete_all_cookies()
+    except Exception as e:
+        logger.warning(f"Could not clear cookies, restarting Chrome for the next page: {e}")
+        _discard_driver()
+
 def html_to_pdf(url: str, name: str) -> str:
     """
     Generate a PDF from the given URL, using `name` for the filename.
     Waits for the main content to load before printing.
     Returns the path to the saved PDF.
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-
-    driver = webdriver.Chrome(
-    service=ChromeService(ChromeDriverManager().install()), 
-    options=options
-)
     pdf_path = ""
+    driver = None
     try:
+        driver = _get_driver()
         driver.get(url)
 
-        # Wait up to 15 seconds for the main content to appear
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "editorial-text"))
-        )
+        _wait_for_content(driver)
 
         # Optional: small sleep to ensure dynamic content loads
         time.sleep(2)
 
-        # Filename from title + uuid
-        filename = slugify(f"{name}-{str(uuid.uuid4())[:8]}")
-        pdf_path = os.path.join(DOWNLOADS_DIR, f"{filename}.pdf")
+        pdf_path = _pdf_path_for(name)
         logger.info(f"Generating PDF for {name} at {pdf_path}")
 
-        # Print to PDF
-        print_options = webdriver.common.print_page_options.PrintOptions()
-        print_options.background = False
-        print_options.header_template = ""
-        print_options.footer_template = ""
-        pdf = driver.print_page(print_options)
-
-        with open(pdf_path, "wb") as f:
-            f.write(base64.b64decode(pdf))
+        _print_page_to_pdf(driver, pdf_path)
+    except TimeoutException as e:
+        # The page never showed its content; the driver itself is still usable
+        logger.warning(f"Failed to generate PDF for {url}: {e}")
+        if driver is not None:
+            _clear_cookies(driver)
+        return ""
     except Exception as e:
         logger.exception(f"Failed to generate PDF for {url}: {e}")
+        # Don't reuse a driver in an unknown state
+        _discard_driver()
         return ""
-    finally:
-        driver.quit()
 
+    _clear_cookies(driver)
     return pdf_path
 
 # --- API scraper functions ---
+def _fetch_page(params: dict) -> dict:
+    logger.info(f"Fetching page {params['page[offset]']} with limit {params['page[limit]']}")
+    response = SESSION.get(BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _fetch_remaining_pages(params: dict, first: int, total_pages: int) -> list[dict]:
+    """Fetch pages first..total_pages concurrently, keeping them in page order."""
+    guidelines = []
+    params_list = [{**params, 'page[offset]': i} for i in range(first, total_pages + 1)]
+    offset = first
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        futures = [executor.submit(_fetch_page, page_params) for page_params in params_list]
+        try:
+            for future in futures:
+                page_guidelines = future.result().get('guidelines', [])
+                if not page_guidelines:
+                    logger.info(f"No guidelines found at page {offset}. Stopping pagination.")
+                    break
+                guidelines.extend(page_guidelines)
+                offset += 1
+        except Exception as e:
+            logger.error(f"Error at page {offset}: {e}")
+        finally:
+            # Once pagination stops, drop the page requests that haven't started yet
+            executor.shutdown(wait=False, cancel_futures=True)
+    return guidelines
+
 def fetch_all_guidelines() -> list[dict]:
     all_guidelines = []
     offset = 1
@@ -103,11 +368,8 @@ def fetch_all_guidelines() -> list[dict]:
 
     while True:
         params['page[offset]'] = offset
-        logger.info(f"Fetching page {offset} with limit {limit}")
         try:
-            response = requests.get(BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = _fetch_page(params)
             guidelines = data.get('guidelines', [])
 
             if not guidelines:
@@ -121,6 +383,11 @@ def fetch_all_guidelines() -> list[dict]:
             if total_pages > 0 and offset >= total_pages:
                 break
 
+            # Page count is known: fetch the rest at once instead of one by one
+            if total_pages > 0:
+                all_guidelines.extend(_fetch_remaining_pages(params, offset + 1, total_pages))
+                break
+
             offset += 1
         except Exception as e:
             logger.error(f"Error at page {offset}: {e}")
@@ -132,8 +399,7 @@ def fetch_all_guidelines() -> list[dict]:
 def filter_public_guidelines(guidelines: list[dict]) -> list[dict]:
     public_guidelines = []
     for guideline in guidelines:
-        guideline_json = json.dumps(guideline)
-        if '"isLoginOnly": false' in guideline_json or '"isLoginOnly":false' in guideline_json:
+        if guideline.get('isLoginOnly') is False:
             public_guidelines.append(guideline)
     logger.info(f"Filtered to {len(public_guidelines)} public guidelines out of {len(guidelines)} total")
     return public_guidelines
@@ -181,44 +447,172 @@ def extract_guideline_data(guideline: dict) -> tuple:
     # Only return fields needed for CSV
     return title, date, publisher, professions, source_label, source_type
 
-def process_guidelines(public_guidelines: list[dict]) -> list[tuple]:
-    detailed_results = []
-    guidelines_to_process = public_guidelines
-    if TEST_MODE:
-        guidelines_to_process = public_guidelines[:MAX_TEST_GUIDELINES]
-        logger.info(f"Test mode enabled: only processing first {MAX_TEST_GUIDELINES} guidelines")
+_guideline_fields = operator.itemgetter('title', 'dates', 'publishers', 'metadata', 'type')
+
+def extract_guideline_data_fast(guideline: dict) -> tuple:
+    """
+    Same as extract_guideline_data, specialised for the schema the API returns
+    (publishers and professions as lists of {"name": ...} dicts). Falls back to
+    extract_guideline_data for anything that doesn't fit.
+    """
+    try:
+        title, dates, publishers, metadata, type_info = _guideline_fields(guideline)
+        date = dates['publishedBySource'] if dates else ''
+        publisher = ' | '.join([pub['name'] for pub in publishers or () if pub['name']])
+        professions = ', '.join([prof['name'] for prof in metadata['professions'] if prof['name']]) if metadata else ''
+        source_label = type_info['label'] if type_info else ''
+        source_type = type_info['sourceType'] if type_info else ''
+    except (KeyError, TypeError):
+        return extract_guideline_data(guideline)
 
-    for i, guideline in enumerate(guidelines_to_process, 1):
+    return title, date, publisher, professions, source_label, source_type
+
+def _render_guideline(i: int, result: tuple, url: str, title: str, csv_queue: queue.Queue):
+    pdf_path = ""
+    try:
+        pdf_path = html_to_pdf(url, title)
+    finally:
+        # The guideline's metadata belongs in the CSV even without a PDF
+        csv_queue.put((i, result + (pdf_path or "",)))
+
+def _process_guideline(i: int, total: int, guideline: dict, csv_queue: queue.Queue,
+                       selenium_pool: ThreadPoolExecutor, selenium_futures: list):
+    queued = False
+    try:
         title = guideline.get('title', 'Unknown Title')
-        logger.info(f"Processing {i}/{len(guidelines_to_process)}: {title}")
-        result = extract_guideline_data(guideline)
+        logger.info(f"Processing {i}/{total}: {title}")
+        result = extract_guideline_data_fast(guideline)
 
         # Keep full URL for PDF generation
         frontend_url = guideline.get('frontendUrl', '')
         full_url = f"{SITE_URL}{frontend_url}" if frontend_url else ''
         pdf_path = ""
         if full_url:
-            pdf_path = html_to_pdf(full_url, title)
+            pdf_path = save_linked_pdf(full_url, title)
+            if not pdf_path:
+                # Page has to be rendered: hand it over to the Chrome workers
+                selenium_futures.append((
+                    title,
+                    selenium_pool.submit(_render_guideline, i, result, full_url, title, csv_queue)
+                ))
+                queued = True
+                return
 
         # Add PDF path to CSV, URL itself is not in CSV
-        detailed_results.append(result + (pdf_path,))
+        csv_queue.put((i, result + (pdf_path,)))
+        queued = True
+    finally:
+        if not queued:
+            # No row for this guideline; don't hold back the rows after it
+            csv_queue.put((i, None))
 
-    return detailed_results
+def process_guidelines(public_guidelines: list[dict], csv_queue: queue.Queue):
+    guidelines_to_process = public_guidelines
+    if TEST_MODE:
+        guidelines_to_process = public_guidelines[:MAX_TEST_GUIDELINES]
+        logger.info(f"Test mode enabled: only processing first {MAX_TEST_GUIDELINES} guidelines")
 
-def save_detailed_csv(detailed_results: list[tuple], filename: str = "public_guidelines_detailed.csv"):
+    # Two stages: many cheap HTTP workers try to download the linked PDF, and
+    # only pages that need a browser go to the few Chrome workers (one driver
+    # each). Both stages feed the same CSV writer.
+    total = len(guidelines_to_process)
+    selenium_futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=SELENIUM_WORKERS) as selenium_pool:
+            with ThreadPoolExecutor(max_workers=FAST_WORKERS) as fast_pool:
+                futures = [
+                    (guideline.get('title', 'Unknown Title'),
+                     fast_pool.submit(_process_guideline, i, total, guideline, csv_queue,
+                                      selenium_pool, selenium_futures))
+                    for i, guideline in enumerate(guidelines_to_process, 1)
+                ]
+    finally:
+        # The Chrome workers are done; don't keep their browsers around until exit
+        _shutdown_all_drivers()
+    for title, future in futures + selenium_futures:
+        if future.exception():
+            logger.error(f"Failed to process guideline {title}: {future.exception()}")
+
+# --- CSV output ---
+def initialize_csv(filename: str = CSV_FILENAME) -> tuple[str, io.TextIOWrapper]:
+    """
+    Create the CSV with its header and return its path and an open stream.
+    The file stays open for the whole run: each row is a write on the same
+    O_APPEND descriptor, and it is only fsynced and closed at exit.
+    """
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     csv_path = os.path.join(OUTPUT_DIR, filename)
 
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            'title', 'published_date', 'publisher',
-            'professions', 'source_label', 'source_type', 'pdf_path'
-        ])
-        writer.writerows(detailed_results)
+    fd = os.open(csv_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    stream = io.TextIOWrapper(os.fdopen(fd, 'wb', buffering=CSV_BUFFER_SIZE), encoding='utf-8', newline='')
+    atexit.register(_close_csv, stream)
 
-    logger.info(f"Saved detailed information for {len(detailed_results)} guidelines to {csv_path}")
-    return csv_path
+    csv.writer(stream).writerow(CSV_HEADER)
+    return csv_path, stream
+
+def _close_csv(stream: io.TextIOWrapper):
+    if stream.closed:
+        return
+    try:
+        stream.flush()
+        os.fsync(stream.fileno())
+    except OSError as e:
+        # Already reported by the writer if the disk filled up during the run
+        logger.error(f"Could not flush the CSV on exit: {e}")
+    finally:
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+def _csv_writer(csv_queue: queue.Queue, stream: io.TextIOWrapper, errors: list):
+    """
+    Single writer for the results CSV: takes (index, row) pairs from
+    `csv_queue` until it receives None and appends the rows to `stream` in
+    index order, i.e. the order the API returned the guidelines in. Rows that
+    arrive early are held until the ones before them are written; a row of
+    None only marks a failed guideline. Rows still held at the end are
+    written in order.
+    If writing fails, the error is appended to `errors` and the queue is still
+    drained, so workers blocked on the bounded queue can finish.
+    """
+    written = 0
+    writer = csv.writer(stream)
+    pending = {}
+    next_index = 1
+
+    def write_rows(rows):
+        nonlocal written
+        for row in rows:
+            if row is None:
+                continue
+            writer.writerow(row)
+            written += 1
+            if written % CSV_FLUSH_EVERY == 0:
+                stream.flush()
+
+    while (item := csv_queue.get()) is not None:
+        if errors:
+            continue
+        pending[item[0]] = item[1]
+        ready = []
+        while next_index in pending:
+            ready.append(pending.pop(next_index))
+            next_index += 1
+        try:
+            write_rows(ready)
+        except Exception as e:
+            logger.exception(f"Failed to write to CSV, dropping remaining rows: {e}")
+            errors.append(e)
+    if not errors:
+        try:
+            write_rows(pending[i] for i in sorted(pending))
+            stream.flush()
+        except Exception as e:
+            logger.exception(f"Failed to write to CSV: {e}")
+            errors.append(e)
+
+    logger.info(f"Saved detailed information for {written} guidelines")
 
 # --- Main ---
 def main():
@@ -234,8 +628,18 @@ def main():
         logger.warning("No public guidelines found (all require login).")
         return
 
-    detailed_results = process_guidelines(public_guidelines)
-    csv_path = save_detailed_csv(detailed_results)
+    csv_path, csv_stream = initialize_csv()
+    csv_queue = queue.Queue(maxsize=CSV_QUEUE_SIZE)
+    csv_errors = []
+    csv_thread = threading.Thread(target=_csv_writer, args=(csv_queue, csv_stream, csv_errors), daemon=True)
+    csv_thread.start()
+    try:
+        process_guidelines(public_guidelines, csv_queue)
+    finally:
+        csv_queue.put(None)
+        csv_thread.join()
+    if csv_errors:
+        raise csv_errors[0]
 
     logger.info("Processing complete!")
     logger.info(f"Results saved to: {csv_path}")